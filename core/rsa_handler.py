@@ -1,15 +1,16 @@
 import binascii
-from json import decoder
-from pyasn1_modules import rfc8017, rfc5208
+import functools
+import os
+import re
 
 from cryptography.exceptions import InvalidSignature
-from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
-from pyasn1.codec.der import decoder
-from pyasn1_modules import rfc2459, rfc8017
 
 def is_valid_rsa_der_public_key(hex_str: str) -> bool:
+    # pyasn1 的 ASN.1 模块加载较慢，仅在需要时导入
+    from pyasn1.codec.der import decoder
+    from pyasn1_modules import rfc2459, rfc8017
     try:
         data = binascii.unhexlify(hex_str)
         subject_public_key_info, _ = decoder.decode(data, asn1Spec=rfc2459.SubjectPublicKeyInfo())
@@ -36,14 +37,41 @@ def is_valid_rsa_der_private_key(hex_str: str) -> bool:
         der_data = binascii.unhexlify(hex_str.strip())
         private_key = serialization.load_der_private_key(
             der_data,
-            password=None,
-            backend=default_backend()
+            password=None
         )
         return True
     except Exception as e:
         print("解析失败：", e)
         return False
 
+# PEM 标识头及各格式的完整头部
+_PEM_BEGIN = b"-----BEGIN "
+_H_PKCS1_PRIV = _PEM_BEGIN + b"RSA PRIVATE KEY-----"
+_H_PKCS8_PRIV = _PEM_BEGIN + b"PRIVATE KEY-----"
+_H_PKCS1_PUB = _PEM_BEGIN + b"RSA PUBLIC KEY-----"
+_H_SPKI_PUB = _PEM_BEGIN + b"PUBLIC KEY-----"
+
+def _try_load(loaders, data):
+    """
+    根据是否含有 PEM 标识头选择 (PEM, DER) 中的一个加载器，避免先解析 PEM 失败再回退 DER；失败时返回 None
+    """
+    pem_loader, der_loader = loaders
+    loader = pem_loader if data.find(_PEM_BEGIN) != -1 else der_loader
+    try:
+        return loader(data)
+    except Exception:
+        return None
+
+_PRIV_LOADERS = (
+    functools.partial(serialization.load_pem_private_key, password=None),
+    functools.partial(serialization.load_der_private_key, password=None),
+)
+
+_PUB_LOADERS = (
+    serialization.load_pem_public_key,
+    serialization.load_der_public_key,
+)
+
 def is_valid_rsa_pem_private_key(data):
     """
     验证RSA私钥是否合法（支持PEM或DER，字符串或bytes）
@@ -51,15 +79,7 @@ def is_valid_rsa_pem_private_key(data):
     if isinstance(data, str):
         data = data.encode()
 
-    try:
-        key = serialization.load_pem_private_key(data, password=None, backend=default_backend())
-    except ValueError:
-        try:
-            key = serialization.load_der_private_key(data, password=None, backend=default_backend())
-        except Exception:
-            return False
-
-    return isinstance(key, rsa.RSAPrivateKey)
+    return isinstance(_try_load(_PRIV_LOADERS, data), rsa.RSAPrivateKey)
 
 def is_valid_rsa_pem_public_key(data):
     """
@@ -68,26 +88,37 @@ def is_valid_rsa_pem_public_key(data):
     if isinstance(data, str):
         data = data.encode()
 
-    try:
-        key = serialization.load_pem_public_key(data, backend=default_backend())
-    except ValueError:
-        try:
-            key = serialization.load_der_public_key(data, backend=default_backend())
-        except Exception:
-            return False
+    return isinstance(_try_load(_PUB_LOADERS, data), rsa.RSAPublicKey)
+
+# PEM 标识头 + base64 正文，用于在完整解析前快速筛选
+_PEM_PRIV_RE = re.compile(rb"-----BEGIN (?:RSA )?PRIVATE KEY-----\s*([A-Za-z0-9+/=\s]+?)\s*-----END")
+_PEM_PUB_RE = re.compile(rb"-----BEGIN (?:RSA )?PUBLIC KEY-----\s*([A-Za-z0-9+/=\s]+?)\s*-----END")
 
-    return isinstance(key, rsa.RSAPublicKey)
+def _pem_body_ok(match) -> bool:
+    """
+    PEM 正文去除空白后，base64 长度必须是 4 的倍数
+    """
+    return len(match.group(1).translate(None, b" \t\r\n")) % 4 == 0
 
 def is_valid_rsa_private_key(data):
-    if is_valid_rsa_pem_private_key(data):
-        return "pem"
+    raw = data.encode() if isinstance(data, str) else data
+    match = _PEM_PRIV_RE.search(raw)
+
+    if match:
+        # 有 PEM 标识头时无需再走 DER 分支
+        if _pem_body_ok(match) and is_valid_rsa_pem_private_key(raw):
+            return "pem"
+        return "err"
     elif is_valid_rsa_der_private_key(data):
         return "der"
     else:
         return "err"
 
 def is_valid_rsa_public_key(data):
-    if is_valid_rsa_pem_public_key(data):
+    raw = data.encode() if isinstance(data, str) else data
+    match = _PEM_PUB_RE.search(raw)
+
+    if match and _pem_body_ok(match) and is_valid_rsa_pem_public_key(raw):
         return "pem"
     elif (data):
         return "der"
@@ -103,8 +134,7 @@ def der_to_pkcs8_priv(der_data: bytes) -> bytes:
     try:
         private_key = serialization.load_der_private_key(
             der_data,
-            password=None,
-            backend=default_backend()
+            password=None
         )
         pem_pkcs8 = private_key.private_bytes(
             encoding=serialization.Encoding.PEM,
@@ -115,17 +145,23 @@ def der_to_pkcs8_priv(der_data: bytes) -> bytes:
     except Exception as e:
         raise ValueError(f"转换失败: {e}")
 
-def pkcs8_to_pkcs1_priv(pkcs8_pem: bytes) -> bytes:
+def _pkcs8_to_pkcs1_priv(pkcs8_pem: bytes) -> tuple[bytes, rsa.RSAPrivateKey]:
     """
-    将 PKCS#8 PEM 私钥转为 PKCS#1 PEM 格式
+    将 PKCS#8 PEM 私钥转为 PKCS#1 PEM 格式，同时返回已解析的私钥对象
     """
-    private_key = serialization.load_pem_private_key(pkcs8_pem, password=None)
+    private_key = _load_priv(pkcs8_pem)
     pkcs1_pem = private_key.private_bytes(
         encoding=serialization.Encoding.PEM,
         format=serialization.PrivateFormat.TraditionalOpenSSL,  # 即 PKCS#1
         encryption_algorithm=serialization.NoEncryption()
     )
-    return pkcs1_pem
+    return pkcs1_pem, private_key
+
+def pkcs8_to_pkcs1_priv(pkcs8_pem: bytes) -> bytes:
+    """
+    将 PKCS#8 PEM 私钥转为 PKCS#1 PEM 格式
+    """
+    return _pkcs8_to_pkcs1_priv(pkcs8_pem)[0]
 
 def pkcs1_to_der_priv(pem_data: bytes) -> bytes:
     """
@@ -134,8 +170,7 @@ def pkcs1_to_der_priv(pem_data: bytes) -> bytes:
     try:
         private_key = serialization.load_pem_private_key(
             pem_data,
-            password=None,
-            backend=default_backend()
+            password=None
         )
         pkcs8_der = private_key.private_bytes(
             encoding=serialization.Encoding.DER,
@@ -147,17 +182,23 @@ def pkcs1_to_der_priv(pem_data: bytes) -> bytes:
         raise ValueError(f"转换失败: {e}")
 
 
-def pkcs1_to_pkcs8_priv(pkcs1_pem: bytes) -> bytes:
+def _pkcs1_to_pkcs8_priv(pkcs1_pem: bytes) -> tuple[bytes, rsa.RSAPrivateKey]:
     """
-    将 PKCS#1 PEM 私钥转为 PKCS#8 PEM 格式
+    将 PKCS#1 PEM 私钥转为 PKCS#8 PEM 格式，同时返回已解析的私钥对象
     """
-    private_key = serialization.load_pem_private_key(pkcs1_pem, password=None)
+    private_key = _load_priv(pkcs1_pem)
     pkcs8_pem = private_key.private_bytes(
         encoding=serialization.Encoding.PEM,
         format=serialization.PrivateFormat.PKCS8,
         encryption_algorithm=serialization.NoEncryption()
     )
-    return pkcs8_pem
+    return pkcs8_pem, private_key
+
+def pkcs1_to_pkcs8_priv(pkcs1_pem: bytes) -> bytes:
+    """
+    将 PKCS#1 PEM 私钥转为 PKCS#8 PEM 格式
+    """
+    return _pkcs1_to_pkcs8_priv(pkcs1_pem)[0]
 
 
 def der_to_spki_pub(der_data: bytes) -> bytes:
@@ -165,7 +206,7 @@ def der_to_spki_pub(der_data: bytes) -> bytes:
     将 DER 编码的公钥转换为 PEM 格式的 SPKI 公钥
     """
     try:
-        public_key = serialization.load_der_public_key(der_data, backend=default_backend())
+        public_key = serialization.load_der_public_key(der_data)
         spki_pem = public_key.public_bytes(
             encoding=serialization.Encoding.PEM,
             format=serialization.PublicFormat.SubjectPublicKeyInfo
@@ -193,7 +234,7 @@ def pkcs1_to_der_pub(pem_data: bytes) -> bytes:
     将 PKCS#1 格式的 PEM 公钥转换为 DER 格式的 SubjectPublicKeyInfo（SPKI）
     """
     try:
-        public_key = serialization.load_pem_public_key(pem_data, backend=default_backend())
+        public_key = serialization.load_pem_public_key(pem_data)
         spki_der = public_key.public_bytes(
             encoding=serialization.Encoding.DER,
             format=serialization.PublicFormat.SubjectPublicKeyInfo
@@ -214,50 +255,98 @@ def pkcs1_pub_to_spki_pub(pkcs1_pem: bytes) -> bytes:
     return spki_pem
 
 
-def convert_private_key_auto(data: bytes) -> str:
+@functools.lru_cache(maxsize=64)
+def _load_priv_cached(pem: bytes):
+    """
+    加载未加密的 PEM 私钥并缓存结果，同一份 PEM 反复转换/签名时只解析一次
+    """
+    return serialization.load_pem_private_key(pem, password=None)
+
+
+def _load_priv(pem, password: bytes = None):
+    """
+    加载 PEM 私钥：未加密时走缓存；带密码时直接解析，避免密码和解密出的私钥常驻缓存
+    """
+    if password is not None:
+        return serialization.load_pem_private_key(pem, password=password)
+    # 缓存键必须可哈希，bytearray/memoryview 等统一转为 bytes
+    return _load_priv_cached(bytes(pem))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_pub_cached(pem: bytes):
+    """
+    加载 PEM 公钥并缓存结果，同一份 PEM 反复转换时只解析一次
+    """
+    return serialization.load_pem_public_key(pem)
+
+
+def convert_private_key_auto(data: bytes) -> bytes:
     """
     自动判断私钥格式并进行 PKCS#1 ⇄ PKCS#8 转换
     - 如果是 PKCS#1，则转换为 PKCS#8
     - 如果是 PKCS#8，则转换为 PKCS#1
+    返回 bytes（PEM 或 DER 的 hex），由界面层按 ASCII 解码
     """
-    key_format = is_valid_rsa_private_key(data)
-    format = is_valid_rsa_private_key(data)
+    try:
+        private_key = _load_priv(data)
+    except Exception:
+        private_key = None
 
-    if key_format == "pem":
-        if b"BEGIN RSA PRIVATE KEY" in data:
+    if isinstance(private_key, rsa.RSAPrivateKey):
+        # 按头部在全文中查找，PEM 前可能还有 Bag Attributes、证书等其他块
+        if data.find(_H_PKCS1_PRIV) != -1:
             # PKCS#1 (PEM) → DER
-            return pkcs1_to_der_priv(data).hex()
-        elif b"BEGIN PRIVATE KEY" in data:
+            return binascii.hexlify(private_key.private_bytes(
+                encoding=serialization.Encoding.DER,
+                format=serialization.PrivateFormat.PKCS8,
+                encryption_algorithm=serialization.NoEncryption()
+            ))
+        elif data.find(_H_PKCS8_PRIV) != -1:
             # PKCS#8 (PEM) → PKCS#1 (PEM)
-            return pkcs8_to_pkcs1_priv(data).decode("utf-8")
+            return private_key.private_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PrivateFormat.TraditionalOpenSSL,
+                encryption_algorithm=serialization.NoEncryption()
+            )
         else:
             raise ValueError("err,无法识别的私钥格式，缺少标识头")
-    elif key_format == "der":
+    elif is_valid_rsa_der_private_key(data):
         # DER → PKCS#8 (PEM)
-        return der_to_pkcs8_priv(bytes.fromhex(data.decode())).decode("utf-8")
+        return der_to_pkcs8_priv(bytes.fromhex(data.decode()))
     else:
         raise ValueError("err,无法识别的私钥格式，缺少标识头")
 
 
-def convert_public_key_auto(data: bytes) -> str:
+def convert_public_key_auto(data: bytes) -> bytes:
     """
     自动判断公钥格式并进行 PKCS#1 ⇄ SPKI 转换
     - 如果是 PKCS#1，则转换为 SPKI
     - 如果是 SPKI，则转换为 PKCS#1
+    返回 bytes（PEM 或 DER 的 hex），由界面层按 ASCII 解码
     """
-    key_format = is_valid_rsa_public_key(data)
+    try:
+        public_key = _load_pub_cached(bytes(data))
+    except Exception:
+        public_key = None
 
-    if key_format == "pem":
-        if b"BEGIN RSA PUBLIC KEY" in data:
+    if isinstance(public_key, rsa.RSAPublicKey):
+        if data.find(_H_PKCS1_PUB) != -1:
             # PKCS#1 -> DER
-            return pkcs1_to_der_pub(data).hex()
-        elif b"BEGIN PUBLIC KEY" in data:
+            return binascii.hexlify(public_key.public_bytes(
+                encoding=serialization.Encoding.DER,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo
+            ))
+        elif data.find(_H_SPKI_PUB) != -1:
             # SPKI -> PKCS#1
-            return spki_to_pkcs1_pub(data).decode("utf-8")
+            return public_key.public_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PublicFormat.PKCS1
+            )
         else:
             raise ValueError("无法识别的公钥格式，缺少标识头")
-    elif key_format == "der":
-        return der_to_spki_pub(bytes.fromhex(data.decode())).decode("utf-8")
+    elif data:
+        return der_to_spki_pub(bytes.fromhex(data.decode()))
     else:
         raise ValueError("err, 无法识别的私钥格式, 缺少标识头")
 
@@ -286,11 +375,41 @@ def extract_public_key_from_private(pem_private_key: bytes, password: bytes = No
         raise ValueError(f"提取公钥失败: {e}")
 
 
+# 哈希算法名 -> 构造函数（名称统一大写）
+_HASHES = {
+    'SHA1': hashes.SHA1,
+    'SHA224': hashes.SHA224,
+    'SHA256': hashes.SHA256,
+    'SHA384': hashes.SHA384,
+    'SHA512': hashes.SHA512,
+    'SHA512_224': hashes.SHA512_224,
+    'SHA512_256': hashes.SHA512_256,
+    'MD5': hashes.MD5,
+    'SM3': hashes.SM3,
+    'SHA3_224': hashes.SHA3_224,
+    'SHA3_256': hashes.SHA3_256,
+    'SHA3_384': hashes.SHA3_384,
+    'SHA3_512': hashes.SHA3_512,
+}
+
+# 填充模式名 -> 以哈希对象构造填充对象
+_PAD_BUILDERS = {
+    'PSS': lambda h: padding.PSS(mgf=padding.MGF1(h), salt_length=padding.PSS.MAX_LENGTH),
+    'PKCS1V15': lambda _h: padding.PKCS1v15(),
+}
+
+
 class RSAUtil:
+    __slots__ = ('_private_key', '_public_key', '_pad_cache', '_export_cache')
+
     def __init__(self, private_key=None, public_key=None, key_size=2048, public_exponent=65537):
         """
         初始化，生成RSA密钥对
         """
+        # (padding_mode, hash_alg) -> (pad, hash_algo)
+        self._pad_cache = {}
+        # 导出结果缓存，更换密钥时清空
+        self._export_cache = {}
         if private_key:
             self.private_key = private_key
             self.public_key = private_key.public_key()
@@ -304,12 +423,30 @@ class RSAUtil:
             )
             self.public_key = self.private_key.public_key()
 
+    @property
+    def private_key(self):
+        return self._private_key
+
+    @private_key.setter
+    def private_key(self, key):
+        self._private_key = key
+        self._export_cache = {}
+
+    @property
+    def public_key(self):
+        return self._public_key
+
+    @public_key.setter
+    def public_key(self, key):
+        self._public_key = key
+        self._export_cache = {}
+
     @staticmethod
     def load_private_key(data: bytes, password: bytes = None):
         """
         从PEM/DER数据加载私钥
         """
-        return serialization.load_pem_private_key(data, password=password)
+        return _load_priv(data, password)
 
     @staticmethod
     def load_public_key(data: bytes):
@@ -322,7 +459,7 @@ class RSAUtil:
     def from_pem(cls, pem_bytes: bytes, password: bytes = None):
         try:
             # 尝试加载私钥
-            private_key = serialization.load_pem_private_key(pem_bytes, password=password)
+            private_key = _load_priv(pem_bytes, password)
             return cls(private_key=private_key)
         except ValueError:
             # 如果无法解析为私钥，则尝试解析为公钥
@@ -338,8 +475,12 @@ class RSAUtil:
 
         encoding: 'PEM' 或 'DER'
         format: 'PKCS1' 或 'PKCS8'
-        password: 加密私钥密码，为 None 时不加密
+        password: 加密私钥密码，为 None 时不加密（仅不加密的导出结果会被缓存）
         """
+        cache_key = ('PRIVATE', encoding.upper(), format.upper())
+        if not password and cache_key in self._export_cache:
+            return self._export_cache[cache_key]
+
         enc = serialization.Encoding.PEM if encoding.upper() == 'PEM' else serialization.Encoding.DER
         fmt = serialization.PrivateFormat.TraditionalOpenSSL if format.upper() == 'PKCS1' else serialization.PrivateFormat.PKCS8
         if password:
@@ -347,21 +488,50 @@ class RSAUtil:
         else:
             encryption_alg = serialization.NoEncryption()
 
-        return self.private_key.private_bytes(
+        data = self.private_key.private_bytes(
             encoding=enc,
             format=fmt,
             encryption_algorithm=encryption_alg
         )
+        if not password:
+            self._export_cache[cache_key] = data
+        return data
 
     def export_public_key(self, encoding='PEM') -> bytes:
         """
         导出公钥，encoding: 'PEM' 或 'DER'
         """
+        cache_key = ('PUBLIC', encoding.upper())
+        if cache_key in self._export_cache:
+            return self._export_cache[cache_key]
+
         enc = serialization.Encoding.PEM if encoding.upper() == 'PEM' else serialization.Encoding.DER
-        return self.public_key.public_bytes(
+        data = self.public_key.public_bytes(
             encoding=enc,
             format=serialization.PublicFormat.SubjectPublicKeyInfo
         )
+        self._export_cache[cache_key] = data
+        return data
+
+    def _get_padding(self, padding_mode, hash_alg):
+        """
+        按 (padding_mode, hash_alg) 获取填充与哈希对象，首次构建后缓存复用
+        """
+        key = (padding_mode.upper(), hash_alg.upper())
+        cached = self._pad_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if key[1] not in _HASHES:
+            raise ValueError(f"Unsupported hash_alg: {hash_alg}")
+        if key[0] not in _PAD_BUILDERS:
+            raise ValueError(f"Unsupported padding_mode: {padding_mode}")
+
+        hash_algo = _HASHES[key[1]]()
+        pad = _PAD_BUILDERS[key[0]](hash_algo)
+
+        self._pad_cache[key] = (pad, hash_algo)
+        return pad, hash_algo
 
     def sign(self, message: bytes, padding_mode='PSS', hash_alg='SHA256') -> bytes:
         """
@@ -372,17 +542,7 @@ class RSAUtil:
 
         返回签名bytes
         """
-        hash_algo = getattr(hashes, hash_alg.upper())()
-
-        if padding_mode.upper() == 'PSS':
-            pad = padding.PSS(
-                mgf=padding.MGF1(hash_algo),
-                salt_length=padding.PSS.MAX_LENGTH
-            )
-        elif padding_mode.upper() == 'PKCS1V15':
-            pad = padding.PKCS1v15()
-        else:
-            raise ValueError(f"Unsupported padding_mode: {padding_mode}")
+        pad, hash_algo = self._get_padding(padding_mode, hash_alg)
 
         return self.private_key.sign(
             message,
@@ -399,17 +559,7 @@ class RSAUtil:
 
         返回bool
         """
-        hash_algo = getattr(hashes, hash_alg.upper())()
-
-        if padding_mode.upper() == 'PSS':
-            pad = padding.PSS(
-                mgf=padding.MGF1(hash_algo),
-                salt_length=padding.PSS.MAX_LENGTH
-            )
-        elif padding_mode.upper() == 'PKCS1V15':
-            pad = padding.PKCS1v15()
-        else:
-            raise ValueError(f"Unsupported padding_mode: {padding_mode}")
+        pad, hash_algo = self._get_padding(padding_mode, hash_alg)
 
         try:
             self.public_key.verify(
@@ -421,3 +571,65 @@ class RSAUtil:
             return True
         except InvalidSignature:
             return False
+
+    def sign_many(self, messages: list, padding_mode='PSS', hash_alg='SHA256', workers: int = None) -> list:
+        """
+        批量签名接口，使用线程池并行调用 OpenSSL（签名期间会释放 GIL）
+
+        messages: 待签名消息列表
+        workers: 线程数，为 None 时取 CPU 核数
+
+        返回与 messages 顺序一致的签名列表
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        pad, hash_algo = self._get_padding(padding_mode, hash_alg)
+
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            return list(executor.map(lambda m: self.private_key.sign(m, pad, hash_algo), messages))
+
+    def verify_many(self, messages: list, signatures: list, padding_mode='PSS', hash_alg='SHA256',
+                    workers: int = None) -> list:
+        """
+        批量验签接口，使用线程池并行调用 OpenSSL
+
+        messages / signatures: 一一对应的消息与签名列表
+        workers: 线程数，为 None 时取 CPU 核数
+
+        返回与 messages 顺序一致的 bool 列表
+        """
+        if len(messages) != len(signatures):
+            raise ValueError("messages 与 signatures 数量不一致")
+
+        from concurrent.futures import ThreadPoolExecutor
+        pad, hash_algo = self._get_padding(padding_mode, hash_alg)
+
+        def _verify(pair):
+            message, signature = pair
+            try:
+                self.public_key.verify(signature, message, pad, hash_algo)
+                return True
+            except InvalidSignature:
+                return False
+
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            return list(executor.map(_verify, zip(messages, signatures)))
+
+
+def convert_and_build_util(pem_data: bytes) -> tuple[bytes, "RSAUtil"]:
+    """
+    PKCS#1 ⇄ PKCS#8 PEM 私钥互转，并复用已解析的私钥构建 RSAUtil，转换后直接签名无需再次解析
+
+    :param pem_data: PKCS#1 或 PKCS#8 格式的 PEM 私钥
+    :return: (转换后的 PEM 私钥, RSAUtil)
+    """
+    if pem_data.find(_H_PKCS1_PRIV) != -1:
+        converted, private_key = _pkcs1_to_pkcs8_priv(pem_data)
+    elif pem_data.find(_H_PKCS8_PRIV) != -1:
+        converted, private_key = _pkcs8_to_pkcs1_priv(pem_data)
+    else:
+        raise ValueError("err,无法识别的私钥格式，缺少标识头")
+
+    if not isinstance(private_key, rsa.RSAPrivateKey):
+        raise ValueError("不是有效的 RSA 私钥")
+
+    return converted, RSAUtil(private_key=private_key)
@@ -393,8 +393,6 @@ def calc_sm2_digest_e(id_hex: str, msg: bytes, pub_key_hex: str) -> str:
 
 from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.backends import default_backend
-
 
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ec
@@ -418,8 +416,7 @@ def generate_sm2_key_pair():
     """
     # 创建 SM2 私钥（使用 brainpoolP256r1 曲线，与 SM2 参数兼容）
     private_key = ec.generate_private_key(
-        ec.BrainpoolP256R1(),
-        default_backend()
+        ec.BrainpoolP256R1()
     )
 
     # 序列化私钥
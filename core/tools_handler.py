@@ -7,8 +7,6 @@ import time
 
 from datetime import datetime
 
-from cryptography.hazmat.backends import default_backend
-
 def get_public_key(path: str) -> str:
     from asn1crypto import pem, x509, keys
     try:
@@ -167,7 +165,7 @@ def get_signature(cert_path: str) -> str:
     with open(cert_path, "rb") as f:
         der_data = f.read()
 
-    cert = x509.load_der_x509_certificate(der_data, default_backend())
+    cert = x509.load_der_x509_certificate(der_data)
     # 获取 DER 编码的签名值
     signature_bytes = cert.signature
     # 返回十六进制字符串
@@ -1,6 +1,27 @@
-import base64
+import binascii
+import functools
 from datetime import datetime
 
+# 优先使用 pybase64（SIMD 加速），未安装时回退到标准库
+try:
+    from pybase64 import b64encode, b64decode
+except ImportError:
+    from base64 import b64encode, b64decode
+
+# hex/base64 输入中需要忽略的空白字符，配合 bytes.translate 一次性剔除
+_WS = b" \t\r\n"
+
+
+# 界面中同一段输入会先后转换为两种格式，缓存解码结果避免重复解码
+@functools.lru_cache(maxsize=8)
+def _unhex(msg: str) -> bytes:
+    return binascii.unhexlify(msg.encode("ascii").translate(None, _WS))
+
+
+@functools.lru_cache(maxsize=8)
+def _unbase64(msg: str) -> bytes:
+    return b64decode(msg.encode("ascii").translate(None, _WS), validate=True)
+
 
 def is_within_validity(start_date_str, end_date_str):
     """
@@ -36,56 +57,46 @@ def convert_to_hex(msg: str, to_format: str = "hex") -> str:
 # hex --> de'c
 def convert_to_dec(msg: str, to_format: str = "dec") -> str:
     to_format = to_format.lower()
-    msg = msg.replace(" ", "")
 
     try:
         # 将十六进制字符串转换为 bytes
-        byte_data = bytes.fromhex(msg)
+        byte_data = _unhex(msg)
         # 将 bytes 解码为 UTF-8 字符串
         return byte_data.decode('utf-8')
     except Exception as e:
         return f"格式转换失败: {e}"
 
 def hex2utf8(msg: str):
-    msg = msg.replace(" ", "")
-
     try:
-        binary_data = bytes.fromhex(msg)         # Hex ➡ bytes
+        binary_data = _unhex(msg)         # Hex ➡ bytes
         return binary_data.decode("utf-8")           # bytes ➡ UTF-8 字符串
     except Exception as e:
         return f"解码失败: {e}"
 
 def hex2base64(msg: str):
-    msg = msg.replace(" ", "")
-
     try:
-        binary_data = bytes.fromhex(msg)         # Hex ➡ bytes
-        return base64.b64encode(binary_data).decode("utf-8")  # bytes ➡ base64字符串
+        binary_data = _unhex(msg)         # Hex ➡ bytes
+        return b64encode(binary_data).decode("ascii")  # bytes ➡ base64字符串
     except Exception as e:
         return f"转换失败: {e}"
 
 def utf82hex(msg: str):
-    msg = msg.replace(" ", "")
-
     try:
-        return msg.encode("utf-8").hex()
+        return msg.encode("utf-8").translate(None, b" ").hex()
     except Exception as e:
         return f"转换失败: {e}"
 
 
 def utf82base64(msg: str):
-    msg = msg.replace(" ", "")
     try:
-        return base64.b64encode(msg.encode("utf-8")).decode("utf-8")
+        return b64encode(msg.encode("utf-8").translate(None, b" ")).decode("ascii")
     except Exception as e:
         return f"转换失败: {e}"
 
 
 def base642hex(msg: str):
-    msg = msg.replace(" ", "")
-
     try:
-        binary = base64.b64decode(msg.encode("utf-8"), validate=True)
+        binary = _unbase64(msg)
         return binary.hex()
     except Exception as e:
         return f"转换失败: {e}"
@@ -93,10 +104,8 @@ def base642hex(msg: str):
 
 
 def base642utf8(msg: str):
-    msg = msg.replace(" ", "")
-
     try:
-        binary = base64.b64decode(msg.encode("utf-8"), validate=True)
+        binary = _unbase64(msg)
         return binary.decode("utf-8")
     except Exception as e:
         return f"转换失败: {e}"
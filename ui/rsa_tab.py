@@ -1,10 +1,10 @@
 import base64
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QLineEdit, QTextEdit, QRadioButton,
-    QGroupBox, QButtonGroup, QTabWidget, QSizePolicy, QSpacerItem, QScrollArea, QComboBox
+    QGroupBox, QButtonGroup, QTabWidget, QSizePolicy, QSpacerItem, QScrollArea, QComboBox, QApplication
 )
 from PyQt5.QtGui import QIntValidator
 
@@ -20,7 +20,7 @@ MIN_VALUE = 1024
 
 allowed_hash_algs = {
             'sha1', 'sha224', 'sha256', 'sha384', 'sha512',
-            'md5', 'blake2b', 'blake2s',
+            'md5',
             'sha3_224', 'sha3_256', 'sha3_384', 'sha3_512'
         }
 
@@ -37,6 +37,10 @@ class RSATab(QWidget):
         self.current_uid_format = "UTF-8"
         self.last_uid_format = "UTF-8"
 
+        # 后台密钥生成线程；本页不是顶层窗口，收不到主窗口的 closeEvent，退出程序时在此等待线程结束
+        self._keygen_thread = None
+        QApplication.instance().aboutToQuit.connect(self._wait_keygen_thread)
+
         self.init_ui()
 
     def init_ui(self):
@@ -182,7 +186,7 @@ class RSATab(QWidget):
 
 
         self.hash_alg_combo = QComboBox()
-        self.hash_alg_combo.addItems(["SHA1","SHA224","SHA256","SHA384","SHA512","MD5","BLAKE2b","BLAKE2s","SHA3_224","SHA3_256","SHA3_384","SHA3_512"])
+        self.hash_alg_combo.addItems(["SHA1","SHA224","SHA256","SHA384","SHA512","MD5","SHA3_224","SHA3_256","SHA3_384","SHA3_512"])
         self.hash_alg_combo.setCurrentText("SHA256")
 
         # 嵌入纵向布局
@@ -219,6 +223,11 @@ class RSATab(QWidget):
 
 
         ##################### 1-密钥对 #####################
+        # 密钥文本缓存：仅在内容变动后才重新读取文档
+        self._keypair_cache = ("", "")
+        self._keypair_dirty = True
+        self.private_key_PKCS.textChanged.connect(self._mark_keypair_dirty)
+        self.public_key_SPKI.textChanged.connect(self._mark_keypair_dirty)
         self.btn_change_priv_key_format.clicked.connect(self.change_priv_key_format)
         self.btn_change_pub_key_format.clicked.connect(self.change_pub_key_format)
         self.btn_generate_key.clicked.connect(self.update_keypair)
@@ -268,17 +277,45 @@ class RSATab(QWidget):
     # -------------------- BEGIN 1-密钥对 --------------------#
     def update_keypair(self):
         step_input_value = self.step_input.get_value()
-        rsa_util = RSAUtil(key_size=step_input_value, public_exponent=65537)
 
+        # 大尺寸密钥生成耗时较长，放到后台线程避免界面卡顿
+        self.btn_generate_key.setEnabled(False)
+        self._set_result("正在生成密钥对...", "orange")
+        self._keygen_thread = RSAKeyGenThread(step_input_value, 65537, self)
+        self._keygen_thread.key_ready.connect(self.on_keypair_generated)
+        self._keygen_thread.failed.connect(self.on_keypair_failed)
+        self._keygen_thread.finished.connect(self._keygen_thread.deleteLater)
+        self._keygen_thread.start()
+
+    def on_keypair_generated(self, rsa_util):
+        self._keygen_thread = None
+        self.btn_generate_key.setEnabled(True)
         private_pem = rsa_util.export_private_key(encoding='DER', format='PKCS8')
         public_pem = rsa_util.export_public_key(encoding='DER')
 
         self.private_key_PKCS.setText(private_pem.hex())
         self.public_key_SPKI.setText(public_pem.hex())
+        self._set_result("密钥对生成成功", "green")
+
+    def on_keypair_failed(self, error):
+        self._keygen_thread = None
+        self.btn_generate_key.setEnabled(True)
+        self._set_result(f"密钥对生成失败：{error}", "red")
+
+    def _wait_keygen_thread(self):
+        # 销毁仍在运行的 QThread 会导致 Qt 直接中止进程，必须等待其结束
+        if self._keygen_thread is not None and self._keygen_thread.isRunning():
+            self._keygen_thread.wait()
+
+    def _mark_keypair_dirty(self):
+        self._keypair_dirty = True
 
     # 获取秘钥
     def get_keypair(self):
-        return self.private_key_PKCS.toPlainText(), self.public_key_SPKI.toPlainText(),
+        if self._keypair_dirty:
+            self._keypair_cache = (self.private_key_PKCS.toPlainText(), self.public_key_SPKI.toPlainText())
+            self._keypair_dirty = False
+        return self._keypair_cache
 
     def change_priv_key_format(self):
         self.result_output.setText("")
@@ -292,7 +329,7 @@ class RSATab(QWidget):
         try:
             res = convert_private_key_auto(priv_key.encode("utf-8"))
 
-            self.private_key_PKCS.setText(res)
+            self.private_key_PKCS.setText(res.decode("ascii"))
             self.result_output.setStyleSheet("color: green;")
             self.result_output.setText("私钥格式转化成功")
         except Exception as e:
@@ -313,13 +350,13 @@ class RSATab(QWidget):
             if priv_key and not pub_key:
                 format = is_valid_rsa_private_key(priv_key)
                 if format == "der":
-                    priv_key = convert_private_key_auto(priv_key.encode("utf-8"))
+                    priv_key = convert_private_key_auto(priv_key.encode("utf-8")).decode("ascii")
 
                 format = is_valid_rsa_private_key(priv_key)
                 if format == "pem":
                     pub_key_der = extract_public_key_from_private(priv_key.encode("utf-8"))
                     pub_key_pem = convert_public_key_auto(pub_key_der)
-                    self.public_key_SPKI.setText(pub_key_pem.strip())
+                    self.public_key_SPKI.setText(pub_key_pem.decode("ascii").strip())
                     self._set_result("提取公钥成功", "green")
                 else:
                     self._set_result("非法私钥", "red")
@@ -329,7 +366,7 @@ class RSATab(QWidget):
             # 2. 提供公钥，尝试格式转换
             if pub_key:
                 res = convert_public_key_auto(pub_key.encode("utf-8"))
-                self.public_key_SPKI.setText(res)
+                self.public_key_SPKI.setText(res.decode("ascii"))
                 self._set_result("公钥格式转换成功", "green")
                 return
 
@@ -503,6 +540,27 @@ class RSATab(QWidget):
             self._set_result("签名验证完成：内容与签名不匹配","red")
     # -------------------- END 3-签名验签 --------------------#
 
+class RSAKeyGenThread(QThread):
+    """
+    后台生成 RSA 密钥对，完成后通过 key_ready 发出 RSAUtil 对象
+    OpenSSL 生成密钥期间会释放 GIL，界面线程可继续响应
+    """
+    key_ready = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, key_size, public_exponent=65537, parent=None):
+        super().__init__(parent)
+        self.key_size = key_size
+        self.public_exponent = public_exponent
+
+    def run(self):
+        try:
+            rsa_util = RSAUtil(key_size=self.key_size, public_exponent=self.public_exponent)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.key_ready.emit(rsa_util)
+
 class StepInputWidget(QWidget):
     def __init__(self, step=1024, minimum=1024, parent=None):
         super().__init__(parent)
@@ -533,20 +591,23 @@ class StepInputWidget(QWidget):
 
         self.setLayout(layout)
 
+        # 当前数值，仅在输入框内容变动时解析一次
+        self._value = minimum
+        self.input.textChanged.connect(self._on_text_changed)
+
         self.btn_minus.clicked.connect(self.decrease)
         self.btn_plus.clicked.connect(self.increase)
 
+    def _on_text_changed(self, text):
+        self._value = int(text) if text.isdigit() else self.minimum
+
     def increase(self):
-        val = max(int(self.input.text()), self.minimum)
-        self.input.setText(str(val + self.step))
+        self._value = max(self._value, self.minimum) + self.step
+        self.input.setText(str(self._value))
 
     def decrease(self):
-        val = max(int(self.input.text()), self.minimum)
-        val = max(val - self.step, self.minimum)
-        self.input.setText(str(val))
+        self._value = max(self._value - self.step, self.minimum)
+        self.input.setText(str(self._value))
 
     def get_value(self):
-        try:
-            return int(self.input.text())
-        except ValueError:
-            return self.minimum
\ No newline at end of file
+        return self._value
\ No newline at end of file